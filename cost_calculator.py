@@ -1,8 +1,7 @@
+import functools
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 
 # Page configuration
@@ -14,7 +13,9 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+@st.cache_resource
+def _inject_css():
+    return """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -36,77 +37,90 @@ st.markdown("""
     .accuracy-medium { color: #ffc107; font-weight: bold; }
     .accuracy-low { color: #dc3545; font-weight: bold; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_inject_css(), unsafe_allow_html=True)
 
 st.markdown('<h1 class="main-header">🌐 Translation App Cost & Performance Calculator</h1>', unsafe_allow_html=True)
 
-# Provider data
-PROVIDERS = {
-    "Google Cloud Translation": {
-        "text_free_tier": 500000,
-        "text_cost_per_million": 20,
-        "stt_free_tier": 60,  # minutes
-        "stt_cost_per_minute": 0.016,
-        "ocr_free_tier": 1000,
-        "ocr_cost_per_1000": 1.50,
-        "languages": 189,
-        "accuracy_text": 92,
-        "accuracy_stt": 95,
-        "accuracy_ocr": 96,
-        "strengths": "Broadest language support, strong API ecosystem"
-    },
-    "Microsoft Azure Translator": {
-        "text_free_tier": 2000000,
-        "text_cost_per_million": 10,
-        "stt_free_tier": 300,  # minutes (5 hours)
-        "stt_cost_per_minute": 1.0,
-        "ocr_free_tier": 5000,
-        "ocr_cost_per_1000": 1.50,
-        "languages": 100,
-        "accuracy_text": 90,
-        "accuracy_stt": 94,
-        "accuracy_ocr": 95,
-        "strengths": "Most generous free tier, excellent for business content"
-    },
-    "Amazon Translate/Transcribe": {
-        "text_free_tier": 2000000,
-        "text_cost_per_million": 15,
-        "stt_free_tier": 60,
-        "stt_cost_per_minute": 0.024,
-        "ocr_free_tier": 1000,
-        "ocr_cost_per_1000": 1.50,
-        "languages": 75,
-        "accuracy_text": 89,
-        "accuracy_stt": 93,
-        "accuracy_ocr": 93,
-        "strengths": "AWS ecosystem integration, competitive pricing"
-    },
-    "DeepL API": {
-        "text_free_tier": 500000,
-        "text_cost_per_million": 25,
-        "stt_free_tier": 0,  # No STT service
-        "stt_cost_per_minute": 0,
-        "ocr_free_tier": 0,  # No OCR service
-        "ocr_cost_per_1000": 0,
-        "languages": 33,
-        "accuracy_text": 96,
-        "accuracy_stt": 0,
-        "accuracy_ocr": 0,
-        "strengths": "Highest translation accuracy, best for European languages"
+# Provider data (built once per server process, shared across reruns)
+@st.cache_resource
+def get_providers():
+    providers = {
+        "Google Cloud Translation": {
+            "text_free_tier": 500000,
+            "text_cost_per_million": 20,
+            "stt_free_tier": 60,  # minutes
+            "stt_cost_per_minute": 0.016,
+            "ocr_free_tier": 1000,
+            "ocr_cost_per_1000": 1.50,
+            "languages": 189,
+            "accuracy_text": 92,
+            "accuracy_stt": 95,
+            "accuracy_ocr": 96,
+            "strengths": "Broadest language support, strong API ecosystem"
+        },
+        "Microsoft Azure Translator": {
+            "text_free_tier": 2000000,
+            "text_cost_per_million": 10,
+            "stt_free_tier": 300,  # minutes (5 hours)
+            "stt_cost_per_minute": 1.0,
+            "ocr_free_tier": 5000,
+            "ocr_cost_per_1000": 1.50,
+            "languages": 100,
+            "accuracy_text": 90,
+            "accuracy_stt": 94,
+            "accuracy_ocr": 95,
+            "strengths": "Most generous free tier, excellent for business content"
+        },
+        "Amazon Translate/Transcribe": {
+            "text_free_tier": 2000000,
+            "text_cost_per_million": 15,
+            "stt_free_tier": 60,
+            "stt_cost_per_minute": 0.024,
+            "ocr_free_tier": 1000,
+            "ocr_cost_per_1000": 1.50,
+            "languages": 75,
+            "accuracy_text": 89,
+            "accuracy_stt": 93,
+            "accuracy_ocr": 93,
+            "strengths": "AWS ecosystem integration, competitive pricing"
+        },
+        "DeepL API": {
+            "text_free_tier": 500000,
+            "text_cost_per_million": 25,
+            "stt_free_tier": 0,  # No STT service
+            "stt_cost_per_minute": 0,
+            "ocr_free_tier": 0,  # No OCR service
+            "ocr_cost_per_1000": 0,
+            "languages": 33,
+            "accuracy_text": 96,
+            "accuracy_stt": 0,
+            "accuracy_ocr": 0,
+            "strengths": "Highest translation accuracy, best for European languages"
+        }
+    }
+
+    offline_specs = {
+        "accuracy_text": 78,
+        "accuracy_stt": 88,
+        "accuracy_ocr": 87,
+        "languages": 52,
+        "app_size_mb": 150,
+        "processing_time_ms": 200,
+        "cpu_usage_percent": 25,
+        "battery_impact": "10-20% additional drain",
+        "one_time_cost": True
     }
-}
-
-OFFLINE_SPECS = {
-    "accuracy_text": 78,
-    "accuracy_stt": 88,
-    "accuracy_ocr": 87,
-    "languages": 52,
-    "app_size_mb": 150,
-    "processing_time_ms": 200,
-    "cpu_usage_percent": 25,
-    "battery_impact": "10-20% additional drain",
-    "one_time_cost": True
-}
+    
+    # Columnar view of providers (one row per provider) for vectorized cost math
+    providers_df = pd.DataFrame.from_dict(providers, orient='index')
+    
+    return providers, providers_df, offline_specs
+
+PROVIDERS, PROVIDERS_DF, OFFLINE_SPECS = get_providers()
+
+ACCURACY_CLASSES = ("accuracy-low", "accuracy-medium", "accuracy-high")
 
 # Sidebar configuration
 st.sidebar.header("📊 Configuration Panel")
@@ -124,6 +138,11 @@ photo_percent = st.sidebar.slider("Photo Translation (OCR) (%)", min_value=0, ma
 voice_percent = 100 - text_percent - photo_percent
 st.sidebar.write(f"Voice Translation: {voice_percent}%")
 
+# Feature shares as fractions, computed once and reused below
+text_fraction = text_percent / 100
+photo_fraction = photo_percent / 100
+voice_fraction = voice_percent / 100
+
 # Actions per session
 st.sidebar.subheader("🎬 Actions per Session")
 text_actions = st.sidebar.number_input("Text translations per session", min_value=1, max_value=50, value=5)
@@ -143,43 +162,154 @@ selected_provider = st.sidebar.selectbox("Choose Cloud Provider", list(PROVIDERS
 st.sidebar.subheader("📱 Offline Consideration")
 include_offline = st.sidebar.checkbox("Compare with Offline Solution", value=False)
 
-# Calculate usage volumes
+# Calculate usage volumes (cached, so provider/offline toggles reuse them)
+@st.cache_data
+def compute_volumes(monthly_users, active_days, sessions_per_day,
+                    text_fraction, photo_fraction, voice_fraction,
+                    text_actions, photo_actions, voice_actions,
+                    avg_text_chars, avg_voice_chars):
+    total_sessions = monthly_users * active_days * sessions_per_day
+    
+    # Text usage
+    text_sessions = total_sessions * text_fraction
+    total_text_chars = text_sessions * text_actions * avg_text_chars
+    
+    # Voice usage (STT + Translation)
+    voice_sessions = total_sessions * voice_fraction
+    total_voice_minutes = voice_sessions * voice_actions * 0.5  # Assume 30 seconds average
+    total_voice_chars = voice_sessions * voice_actions * avg_voice_chars
+    
+    # Photo usage (OCR + Translation)
+    photo_sessions = total_sessions * photo_fraction
+    total_photo_images = photo_sessions * photo_actions
+    total_photo_chars = photo_sessions * photo_actions * 200  # Assume 200 chars per photo
+    
+    # Total volumes: translation characters, STT minutes, OCR images
+    return total_text_chars + total_voice_chars + total_photo_chars, total_voice_minutes, total_photo_images
+
 total_sessions = monthly_users * active_days * sessions_per_day
+total_chars_for_translation, total_stt_minutes, total_ocr_images = compute_volumes(
+    monthly_users, active_days, sessions_per_day,
+    text_fraction, photo_fraction, voice_fraction,
+    text_actions, photo_actions, voice_actions,
+    avg_text_chars, avg_voice_chars
+)
+
+# Cost kernel on plain arrays; usage and pricing inputs broadcast against each other,
+# so the same kernel serves a single provider, all providers, or a provider x usage grid
+def _costs(chars, stt_mins, ocr_imgs, text_free, text_per_million, stt_free, stt_per_minute, ocr_free, ocr_per_1000):
+    text_cost = (np.maximum(0, chars - text_free) / 1000000) * text_per_million
+    stt_cost = np.maximum(0, stt_mins - stt_free) * stt_per_minute
+    ocr_cost = (np.maximum(0, ocr_imgs - ocr_free) / 1000) * ocr_per_1000
+    return text_cost, stt_cost, ocr_cost
+
+# Cost calculation function (one row of costs per provider row in providers_df)
+def calculate_costs(providers_df, chars, stt_mins, ocr_imgs):
+    return _costs(
+        chars, stt_mins, ocr_imgs,
+        providers_df["text_free_tier"].values, providers_df["text_cost_per_million"].values,
+        providers_df["stt_free_tier"].values, providers_df["stt_cost_per_minute"].values,
+        providers_df["ocr_free_tier"].values, providers_df["ocr_cost_per_1000"].values
+    )
 
-# Text usage
-text_sessions = total_sessions * (text_percent / 100)
-total_text_chars = text_sessions * text_actions * avg_text_chars
-
-# Voice usage (STT + Translation)
-voice_sessions = total_sessions * (voice_percent / 100)
-total_voice_minutes = voice_sessions * voice_actions * 0.5  # Assume 30 seconds average
-total_voice_chars = voice_sessions * voice_actions * avg_voice_chars
-
-# Photo usage (OCR + Translation)
-photo_sessions = total_sessions * (photo_percent / 100)
-total_photo_images = photo_sessions * photo_actions
-total_photo_chars = photo_sessions * photo_actions * 200  # Assume 200 chars per photo
-
-# Total volumes
-total_chars_for_translation = total_text_chars + total_voice_chars + total_photo_chars
-total_stt_minutes = total_voice_minutes
-total_ocr_images = total_photo_images
-
-# Cost calculation function
-def calculate_costs(provider_data, chars, stt_mins, ocr_imgs):
-    # Text translation costs
-    chars_after_free = max(0, chars - provider_data["text_free_tier"])
-    text_cost = (chars_after_free / 1000000) * provider_data["text_cost_per_million"]
+# Costs for a single provider (keyed on provider name, since provider rows aren't hashable)
+@st.cache_data
+def selected_provider_costs(provider_name, chars, stt_mins, ocr_imgs):
+    text_cost, stt_cost, ocr_cost = calculate_costs(
+        PROVIDERS_DF.loc[[provider_name]], chars, stt_mins, ocr_imgs
+    )
+    return float(text_cost[0]), float(stt_cost[0]), float(ocr_cost[0])
+
+# Cost sweep across all providers, sorted by monthly cost
+@st.cache_data
+def all_provider_costs(total_chars, total_stt_minutes, total_ocr_images):
+    text_c, stt_c, ocr_c = calculate_costs(PROVIDERS_DF, total_chars, total_stt_minutes, total_ocr_images)
+    total_c = text_c + stt_c + ocr_c
     
-    # STT costs
-    stt_after_free = max(0, stt_mins - provider_data["stt_free_tier"])
-    stt_cost = stt_after_free * provider_data["stt_cost_per_minute"]
+    provider_costs = pd.DataFrame({
+        'Provider': PROVIDERS_DF.index,
+        'Monthly Cost': total_c,
+        'Annual Cost': total_c * 12,
+        'Text Accuracy': PROVIDERS_DF['accuracy_text'].values,
+        'Languages': PROVIDERS_DF['languages'].values,
+        'Free Tier (chars)': PROVIDERS_DF['text_free_tier'].map('{:,}'.format).values
+    })
     
-    # OCR costs
-    ocr_after_free = max(0, ocr_imgs - provider_data["ocr_free_tier"])
-    ocr_cost = (ocr_after_free / 1000) * provider_data["ocr_cost_per_1000"]
+    return provider_costs.sort_values('Monthly Cost')
+
+# Per-service split of the selected provider's monthly cost
+@st.cache_data
+def build_cost_breakdown(text_cost, stt_cost, ocr_cost):
+    total_cost = text_cost + stt_cost + ocr_cost
+    return pd.DataFrame({
+        'Service': ['Text Translation', 'Speech-to-Text', 'OCR'],
+        'Cost': [text_cost, stt_cost, ocr_cost],
+        'Percentage': [
+            (text_cost/total_cost)*100 if total_cost > 0 else 0,
+            (stt_cost/total_cost)*100 if total_cost > 0 else 0,
+            (ocr_cost/total_cost)*100 if total_cost > 0 else 0
+        ]
+    })
+
+# Cost breakdown pie chart, rebuilt only when the costs change
+@st.cache_data
+def build_cost_pie(provider_name, text_cost, stt_cost, ocr_cost):
+    cost_breakdown = build_cost_breakdown(text_cost, stt_cost, ocr_cost)
+    return px.pie(cost_breakdown, values='Cost', names='Service', 
+                  title=f"Monthly Cost Breakdown - {provider_name}")
+
+# CSS class for an accuracy rating: <90 low, 90-94 medium, >=95 high
+@functools.lru_cache(maxsize=None)
+def get_accuracy_class(accuracy):
+    return ACCURACY_CLASSES[int(accuracy >= 90) + int(accuracy >= 95)]
+
+# Usage volumes against the selected provider's free tier
+@st.cache_data
+def build_volume_df(total_chars, total_minutes, total_images, free_chars, free_minutes, free_images):
+    volumes = np.array([total_chars, total_minutes, total_images], dtype=float)
+    free_tiers = np.array([free_chars, free_minutes, free_images], dtype=int)
+    return pd.DataFrame({
+        'Metric': ['Characters for Translation', 'STT Minutes', 'OCR Images'],
+        'Volume': volumes,
+        'Free Tier': free_tiers,
+        'Billable': np.maximum(0, volumes - free_tiers)
+    })
+
+# Cost vs accuracy scatter for the provider comparison table
+@st.cache_data
+def build_cost_scatter(comparison_df):
+    fig_scatter = px.scatter(comparison_df, x='Text Accuracy', y='Monthly Cost', 
+                            size='Languages', hover_name='Provider',
+                            title='Cost vs Accuracy Analysis',
+                            labels={'Text Accuracy': 'Text Translation Accuracy (%)', 
+                                   'Monthly Cost': 'Monthly Cost ($)'})
     
-    return text_cost, stt_cost, ocr_cost
+    fig_scatter.update_traces(marker=dict(sizemode='diameter', sizeref=max(comparison_df['Languages'])/100))
+    return fig_scatter
+
+# Cloud vs offline comparison table
+@st.cache_data
+def build_offline_comparison(provider_name, monthly_cost):
+    provider_data = PROVIDERS_DF.loc[provider_name]
+    return pd.DataFrame({
+        'Metric': ['Text Accuracy', 'STT Accuracy', 'OCR Accuracy', 'Languages', 'Monthly Cost', 'Response Time'],
+        'Cloud (Selected Provider)': [
+            f"{provider_data['accuracy_text']}%",
+            f"{provider_data['accuracy_stt']}%" if provider_data['accuracy_stt'] > 0 else "N/A",
+            f"{provider_data['accuracy_ocr']}%" if provider_data['accuracy_ocr'] > 0 else "N/A",
+            str(provider_data['languages']),
+            f"${monthly_cost:.2f}",
+            "200-1000ms + network"
+        ],
+        'Offline Solution': [
+            f"{OFFLINE_SPECS['accuracy_text']}%",
+            f"{OFFLINE_SPECS['accuracy_stt']}%",
+            f"{OFFLINE_SPECS['accuracy_ocr']}%",
+            str(OFFLINE_SPECS['languages']),
+            "$0 (one-time dev cost)",
+            f"{OFFLINE_SPECS['processing_time_ms']}ms"
+        ]
+    })
 
 # Main content area
 col1, col2 = st.columns([2, 1])
@@ -188,9 +318,9 @@ with col1:
     st.header("📊 Cost Analysis")
     
     # Calculate costs for selected provider
-    provider_data = PROVIDERS[selected_provider]
-    text_cost, stt_cost, ocr_cost = calculate_costs(
-        provider_data, total_chars_for_translation, total_stt_minutes, total_ocr_images
+    provider_data = PROVIDERS_DF.loc[selected_provider]
+    text_cost, stt_cost, ocr_cost = selected_provider_costs(
+        selected_provider, total_chars_for_translation, total_stt_minutes, total_ocr_images
     )
     total_monthly_cost = text_cost + stt_cost + ocr_cost
     annual_cost = total_monthly_cost * 12
@@ -209,56 +339,28 @@ with col1:
     
     # Cost breakdown chart
     if total_monthly_cost > 0:
-        cost_breakdown = pd.DataFrame({
-            'Service': ['Text Translation', 'Speech-to-Text', 'OCR'],
-            'Cost': [text_cost, stt_cost, ocr_cost],
-            'Percentage': [
-                (text_cost/total_monthly_cost)*100 if total_monthly_cost > 0 else 0,
-                (stt_cost/total_monthly_cost)*100 if total_monthly_cost > 0 else 0,
-                (ocr_cost/total_monthly_cost)*100 if total_monthly_cost > 0 else 0
-            ]
-        })
-        
-        fig_pie = px.pie(cost_breakdown, values='Cost', names='Service', 
-                        title=f"Monthly Cost Breakdown - {selected_provider}")
+        fig_pie = build_cost_pie(selected_provider, text_cost, stt_cost, ocr_cost)
         st.plotly_chart(fig_pie, use_container_width=True)
     
     # Usage volume breakdown
     st.subheader("📈 Usage Volume Breakdown")
     
-    volume_data = pd.DataFrame({
-        'Metric': ['Characters for Translation', 'STT Minutes', 'OCR Images'],
-        'Volume': [
-            f"{total_chars_for_translation:,.0f}",
-            f"{total_stt_minutes:,.1f}",
-            f"{total_ocr_images:,.0f}"
-        ],
-        'Free Tier': [
-            f"{provider_data['text_free_tier']:,}",
-            f"{provider_data['stt_free_tier']:,}",
-            f"{provider_data['ocr_free_tier']:,}"
-        ],
-        'Billable': [
-            f"{max(0, total_chars_for_translation - provider_data['text_free_tier']):,.0f}",
-            f"{max(0, total_stt_minutes - provider_data['stt_free_tier']):,.1f}",
-            f"{max(0, total_ocr_images - provider_data['ocr_free_tier']):,.0f}"
-        ]
-    })
+    volume_data = build_volume_df(
+        total_chars_for_translation, total_stt_minutes, total_ocr_images,
+        provider_data['text_free_tier'], provider_data['stt_free_tier'], provider_data['ocr_free_tier']
+    )
     
-    st.dataframe(volume_data, use_container_width=True)
+    # Numbers are formatted client-side
+    st.dataframe(volume_data, use_container_width=True, column_config={
+        'Volume': st.column_config.NumberColumn(format='%,.1f'),
+        'Free Tier': st.column_config.NumberColumn(format='%,d'),
+        'Billable': st.column_config.NumberColumn(format='%,.1f')
+    })
 
 with col2:
     st.header("🎯 Provider Specs")
     
     # Provider accuracy display
-    def get_accuracy_class(accuracy):
-        if accuracy >= 95:
-            return "accuracy-high"
-        elif accuracy >= 90:
-            return "accuracy-medium"
-        else:
-            return "accuracy-low"
-    
     st.markdown(f"### {selected_provider}")
     st.markdown(f"**Languages Supported:** {provider_data['languages']}")
     st.markdown(f"**Strengths:** {provider_data['strengths']}")
@@ -270,51 +372,23 @@ with col2:
     
     # Free tier status
     st.markdown("**Free Tier Usage:**")
-    text_free_usage = (total_chars_for_translation / provider_data['text_free_tier']) * 100 if provider_data['text_free_tier'] > 0 else 100
-    stt_free_usage = (total_stt_minutes / provider_data['stt_free_tier']) * 100 if provider_data['stt_free_tier'] > 0 else 100
-    ocr_free_usage = (total_ocr_images / provider_data['ocr_free_tier']) * 100 if provider_data['ocr_free_tier'] > 0 else 100
-    
-    st.progress(min(text_free_usage/100, 1.0))
-    st.caption(f"Text: {text_free_usage:.1f}% of free tier used")
-    
-    if provider_data['stt_free_tier'] > 0:
-        st.progress(min(stt_free_usage/100, 1.0))
-        st.caption(f"STT: {stt_free_usage:.1f}% of free tier used")
-    else:
-        st.warning("⚠️ No STT service available")
+    volumes = np.array([total_chars_for_translation, total_stt_minutes, total_ocr_images], dtype=float)
+    frees = np.array([provider_data['text_free_tier'], provider_data['stt_free_tier'], provider_data['ocr_free_tier']], dtype=float)
+    free_usages = np.where(frees > 0, volumes / np.maximum(frees, 1) * 100, 100)
     
-    if provider_data['ocr_free_tier'] > 0:
-        st.progress(min(ocr_free_usage/100, 1.0))
-        st.caption(f"OCR: {ocr_free_usage:.1f}% of free tier used")
-    else:
-        st.warning("⚠️ No OCR service available")
+    for service, free_usage, free in zip(('Text', 'STT', 'OCR'), free_usages, frees):
+        if free > 0:
+            st.progress(min(free_usage/100, 1.0))
+            st.caption(f"{service}: {free_usage:.1f}% of free tier used")
+        else:
+            st.warning(f"⚠️ No {service} service available")
 
 # Offline comparison section
 if include_offline:
     st.header("📱 Offline vs Cloud Comparison")
     
     # Create comparison dataframe
-    comparison_data = {
-        'Metric': ['Text Accuracy', 'STT Accuracy', 'OCR Accuracy', 'Languages', 'Monthly Cost', 'Response Time'],
-        'Cloud (Selected Provider)': [
-            f"{provider_data['accuracy_text']}%",
-            f"{provider_data['accuracy_stt']}%" if provider_data['accuracy_stt'] > 0 else "N/A",
-            f"{provider_data['accuracy_ocr']}%" if provider_data['accuracy_ocr'] > 0 else "N/A",
-            str(provider_data['languages']),
-            f"${total_monthly_cost:.2f}",
-            "200-1000ms + network"
-        ],
-        'Offline Solution': [
-            f"{OFFLINE_SPECS['accuracy_text']}%",
-            f"{OFFLINE_SPECS['accuracy_stt']}%",
-            f"{OFFLINE_SPECS['accuracy_ocr']}%",
-            str(OFFLINE_SPECS['languages']),
-            "$0 (one-time dev cost)",
-            f"{OFFLINE_SPECS['processing_time_ms']}ms"
-        ]
-    }
-    
-    comparison_df = pd.DataFrame(comparison_data)
+    comparison_df = build_offline_comparison(selected_provider, total_monthly_cost)
     st.dataframe(comparison_df, use_container_width=True)
     
     # Offline considerations
@@ -351,29 +425,14 @@ if include_offline:
             st.warning(f"⚠️ Offline solution pays for itself in {payback_months:.1f} months")
         else:
             st.error(f"❌ Long payback period: {payback_months:.1f} months")
+    else:
+        st.info("No monthly cloud cost for this workload, so there is nothing for an offline solution to pay back.")
 
 # Provider comparison section
 st.header("🏢 All Providers Comparison")
 
 # Calculate costs for all providers
-all_provider_costs = []
-for provider_name, provider_info in PROVIDERS.items():
-    text_c, stt_c, ocr_c = calculate_costs(provider_info, total_chars_for_translation, total_stt_minutes, total_ocr_images)
-    total_c = text_c + stt_c + ocr_c
-    
-    all_provider_costs.append({
-        'Provider': provider_name,
-        'Monthly Cost': total_c,
-        'Annual Cost': total_c * 12,
-        'Text Accuracy': provider_info['accuracy_text'],
-        'Languages': provider_info['languages'],
-        'Free Tier (chars)': f"{provider_info['text_free_tier']:,}"
-    })
-
-comparison_df = pd.DataFrame(all_provider_costs)
-
-# Sort by cost
-comparison_df = comparison_df.sort_values('Monthly Cost')
+comparison_df = all_provider_costs(total_chars_for_translation, total_stt_minutes, total_ocr_images)
 
 # Display comparison table
 st.dataframe(comparison_df.style.format({
@@ -382,15 +441,12 @@ st.dataframe(comparison_df.style.format({
     'Text Accuracy': '{:.0f}%'
 }), use_container_width=True)
 
-# Cost vs Accuracy scatter plot
-fig_scatter = px.scatter(comparison_df, x='Text Accuracy', y='Monthly Cost', 
-                        size='Languages', hover_name='Provider',
-                        title='Cost vs Accuracy Analysis',
-                        labels={'Text Accuracy': 'Text Translation Accuracy (%)', 
-                               'Monthly Cost': 'Monthly Cost ($)'})
-
-fig_scatter.update_traces(marker=dict(sizemode='diameter', sizeref=max(comparison_df['Languages'])/100))
-st.plotly_chart(fig_scatter, use_container_width=True)
+# Cost vs Accuracy scatter plot (meaningless when every provider costs $0)
+if comparison_df['Monthly Cost'].max() > 0:
+    fig_scatter = build_cost_scatter(comparison_df)
+    st.plotly_chart(fig_scatter, use_container_width=True)
+else:
+    st.info("All providers currently within free tier for this workload.")
 
 # Footer
 st.markdown("---")